@@ -1,15 +1,37 @@
 from time import time
+import json
 import os
 import sys
+import tracemalloc
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
 from singly_linkedlist.singly_linkedlist import SinglyLinkedList
 
-start = time()
-linked_list = SinglyLinkedList()
-for i in range(100000):
-    linked_list.insert_head(111111111111)
-end = time()
-print("Took {0} seconds".format(start-end))
-# linked_list.print_elements()
+# run benchmarks only as a script, not when pytest collects this file
+if __name__ == '__main__':
+    start = time()
+    linked_list = SinglyLinkedList()
+    for i in range(100000):
+        linked_list.insert_head(111111111111)
+    end = time()
+    print("Took {0} seconds".format(start-end))
+    # linked_list.print_elements()
 
+    # Memory: bytes allocated per node, measured with tracemalloc.
+    # Pass a file name as first argument to append the result as a JSON
+    # line, so that regressions show up when comparing runs over time.
+    node_count = 100000
+    linked_list.clear()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    linked_list = SinglyLinkedList.from_chunks([[None] * node_count])
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    bytes_per_node = (after - before) / node_count
+    print("Bytes per node: {0:.1f}".format(bytes_per_node))
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], 'a') as history_file:
+            history_file.write(json.dumps({'time': end,
+                                           'python': sys.version.split()[0],
+                                           'bytes_per_node': bytes_per_node})
+                               + '\n')
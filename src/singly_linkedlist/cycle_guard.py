@@ -0,0 +1,188 @@
+"""Cycle guard used by SinglyLinkedList.link(). """
+
+# spacing between order stamps of consecutive nodes
+ORDER_GAP = 1 << 20
+
+
+class GuardStamp:          # pylint: disable=too-few-public-methods
+    """Cycle guard metadata of a node, kept in Node.guard"""
+    __slots__ = ('owner', 'order', 'refs')
+
+    def __init__(self, owner, order, refs):
+        self.owner = owner
+        self.order = order
+        self.refs = refs
+
+
+class CycleGuard:
+    """Order stamps of the nodes of one linked list, used to check whether
+       a link creates a cycle without traversing the list.
+       Nodes stamped with the current token belong to the list, their
+       order increases along next links(except across cycle_link) and
+       refs is at least the number of nodes of the list linking to them.
+       A token of None means the stamps must be rebuilt from head
+    """
+    def __init__(self):
+        self.token = None
+        # (node, next node) of the link that closed the cycle, if any
+        self.cycle_link = None
+
+    def invalidate(self):
+        """Discard the stamps, so that they are rebuilt by ready()"""
+        self.token = None
+        self.cycle_link = None
+
+    def ready(self, head):
+        """Rebuild the stamps from head if they are out of date,
+           recording the link which closes a cycle, if any
+        """
+        if self.token is not None:
+            return
+        token = object()
+        self.token = token
+        order = 0
+        previous_node = None
+        current_node = head
+        while current_node is not None:
+            stamp = current_node.guard
+            if stamp is not None and stamp.owner is token:
+                self.cycle_link = (previous_node, current_node)
+                stamp.refs += 1
+                break
+            self.__stamp(current_node, order,
+                         0 if previous_node is None else 1)
+            order += ORDER_GAP
+            previous_node = current_node
+            current_node = current_node.next
+
+    def owns(self, node):
+        """Return True if node(any object) is a node of the list"""
+        stamp = getattr(node, 'guard', None)
+        return (self.token is not None and isinstance(stamp, GuardStamp)
+                and stamp.owner is self.token)
+
+    def nodes_removed(self):
+        """Update the guard after nodes were unlinked. Removing nodes
+           keeps the order stamps increasing, but may break a cycle
+        """
+        if self.cycle_link is not None:
+            self.invalidate()
+
+    def inserted_after(self, previous_node, node):
+        """Stamp a node inserted after previous_node(None for the head),
+           if the stamps are up to date
+        """
+        if self.token is None:
+            return
+        if self.cycle_link is not None:
+            self.invalidate()
+        elif previous_node is not None:
+            self.__stamp(node, previous_node.guard.order, 1)
+            self.__restamp_after(previous_node)
+        elif node.next is not None:
+            self.__stamp(node, node.next.guard.order - ORDER_GAP, 0)
+            node.next.guard.refs += 1
+        else:
+            self.__stamp(node, 0, 0)
+
+    def linked(self, node):
+        """Count a link to node added by unlinking the node before it
+           (that node still links to it as well)
+        """
+        if self.token is not None and node is not None:
+            node.guard.refs += 1
+
+    def creates_cycle(self, node, next_node):
+        """Return True if linking node to next_node creates a cycle.
+           O(1) when next_node is ordered after node or no node links to
+           node, else only the nodes ordered between them are walked.
+           While a cycle is recorded, the stamps cannot tell and False is
+           returned
+        """
+        if next_node is None or self.cycle_link is not None:
+            return False
+        order = node.guard.order
+        if next_node.guard.order > order:
+            return False
+        if node.guard.refs == 0 and next_node is not node:
+            return False
+        # node can only be reached from next_node through nodes which are
+        # not ordered after node
+        current_node = next_node
+        while current_node is not None and current_node.guard.order <= order:
+            if current_node is node:
+                return True
+            current_node = current_node.next
+        return False
+
+    def link(self, head, node, next_node, creates_cycle):
+        """Set node.next to next_node, updating the stamps.
+           creates_cycle is the result of creates_cycle(node, next_node)
+        """
+        if self.cycle_link is not None:
+            # order stamps do not hold across the closing link,
+            # rebuild them lazily
+            node.next = next_node
+            self.invalidate()
+        elif creates_cycle:
+            # only a cycle reachable from head is a cycle of the list,
+            # checked once when the cycle is created
+            current_node = head
+            while current_node is not None and current_node is not node:
+                current_node = current_node.next
+            node.next = next_node
+            if current_node is node:
+                self.cycle_link = (node, next_node)
+            else:
+                # cycle among detached nodes, the rebuild from head
+                # drops them from the nodes of the list
+                self.invalidate()
+        elif next_node is None or next_node.guard.order > node.guard.order:
+            self.__set_next(node, next_node)
+        elif node.guard.refs == 0:
+            # no node links to node, so it can be ordered before next_node
+            node.guard.order = next_node.guard.order - ORDER_GAP
+            self.__set_next(node, next_node)
+        else:
+            self.__set_next(node, next_node)
+            self.__restamp_after(node)
+
+    def __stamp(self, node, order, refs):
+        """ Stamp node as a node of the list, reusing its stamp object"""
+        if node.guard is None:
+            node.guard = GuardStamp(self.token, order, refs)
+        else:
+            node.guard.owner = self.token
+            node.guard.order = order
+            node.guard.refs = refs
+
+    @staticmethod
+    def __set_next(node, next_node):
+        """ Set node.next, updating the link counts"""
+        if node.next is not None:
+            node.next.guard.refs -= 1
+        node.next = next_node
+        if next_node is not None:
+            next_node.guard.refs += 1
+
+    @staticmethod
+    def __restamp_after(node):
+        """ Raise the order stamps of the nodes after node which are not
+            ordered after their previous node. Stamps are only raised, so
+            links from other nodes stay ordered, and the first node which
+            fits into the gap before its next node ends the restamping
+        """
+        previous_order = node.guard.order
+        current_node = node.next
+        while (current_node is not None and
+               current_node.guard.order <= previous_order):
+            next_node = current_node.next
+            if next_node is None:
+                order = previous_order + ORDER_GAP
+            elif next_node.guard.order > previous_order + 1:
+                order = (previous_order + next_node.guard.order) // 2
+            else:
+                order = previous_order + 1
+            current_node.guard.order = order
+            previous_order = order
+            current_node = next_node
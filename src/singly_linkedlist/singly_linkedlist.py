@@ -1,4 +1,19 @@
 """Singly linked list. """
+import argparse
+import contextlib
+import functools
+import gc
+import struct
+import sys
+import tracemalloc
+
+from singly_linkedlist.cycle_guard import CycleGuard
+
+# default number of nodes unlinked per teardown step
+TEARDOWN_BATCH_SIZE = 10000
+# default number of characters read per chunk(approximate, whole lines)
+# by SinglyLinkedList.from_file()
+LOAD_CHUNK_SIZE = 1 << 20
 
 
 class SinglyLinkedListException(Exception):
@@ -21,17 +36,154 @@ class SinglyLinkedListEmptyError(SinglyLinkedListException):
         self.message = message
 
 
+class SinglyLinkedListCycleError(SinglyLinkedListException):
+    """ Link would create a cycle"""
+    def __init__(self, message="link would create a cycle"):
+        super().__init__(message)
+        self.message = message
+
+
+class SinglyLinkedListNodeError(SinglyLinkedListException):
+    """ Node is not part of the linked list"""
+    def __init__(self, message="node is not part of the linked list"):
+        super().__init__(message)
+        self.message = message
+
+
+@contextlib.contextmanager
+def gc_paused(freeze=False):
+    """Context manager that disables the cyclic garbage collector while
+       bulk-building or bulk-tearing large lists.
+       If freeze is True, gc.freeze()(Python 3.7+) is called on exit. This
+       moves every object tracked by the GC in the whole process, not only
+       the list, to the permanent generation so later collections do not
+       rescan them. Call gc_unfreeze() to make them collectable again.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if freeze and hasattr(gc, 'freeze'):
+            gc.freeze()
+        if was_enabled:
+            gc.enable()
+
+
+def gc_unfreeze():
+    """Move objects frozen by gc_paused(freeze=True) back to the oldest
+       generation, so that the cyclic GC scans and collects them again
+    """
+    if hasattr(gc, 'unfreeze'):
+        gc.unfreeze()
+
+
 class Node:                # pylint: disable=too-few-public-methods
     """Class representing a node in a linked list"""
     def __init__(self, data):
         self.data = data
         self.next = None
+        # GuardStamp while in a linked list with a cycle guard
+        self.guard = None
+
 
+class _CompactNode:         # pylint: disable=too-few-public-methods
+    """Node with __slots__, used to estimate compact node savings"""
+    __slots__ = ('data', 'next')
 
-class SinglyLinkedList:
+    def __init__(self, data):
+        self.data = data
+        self.next = None
+
+
+@functools.lru_cache(maxsize=None)
+def _node_size(node_class, probes=1000):
+    """ Return average bytes allocated for one instance of node_class,
+        measured with tracemalloc(sys.getsizeof() misses attribute storage)
+    """
+    start_tracing = not tracemalloc.is_tracing()
+    if start_tracing:
+        tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        nodes = [node_class(None) for _ in range(probes)]
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        if start_tracing:
+            tracemalloc.stop()
+    # exclude the Python list holding the probes
+    return round((after - before - sys.getsizeof(nodes)) / probes)
+
+
+class SinglyLinkedList:  # pylint: disable=too-many-public-methods
     """Linked list class representing a collection of linked nodes"""
-    def __init__(self):
+    def __init__(self, cycle_guard=None):
+        """cycle_guard enables cycle checks in link():
+           None - no checks, 'reject' - raise SinglyLinkedListCycleError,
+           'record' - allow the link and remember it as the cycle
+        """
+        if cycle_guard not in (None, 'reject', 'record'):
+            raise ValueError("cycle_guard must be None, 'reject' or "
+                             "'record': {0}".format(cycle_guard))
         self.head = None
+        # chains of detached nodes waiting for incremental teardown
+        self._pending_teardown = []
+        self.cycle_guard = cycle_guard
+        # order stamps of the nodes, only built when cycle_guard is set
+        self._guard = CycleGuard()
+
+    @classmethod
+    def from_chunks(cls, batches, progress=None):
+        """Build a linked list from an iterable of batches(iterables of data),
+           appending each batch straight onto the tail.
+           progress, if given, is called with the number of nodes loaded
+           so far after each batch
+        """
+        linked_list = cls()
+        tail = None
+        loaded = 0
+        for batch in batches:
+            for data in batch:
+                new_node = Node(data)
+                if tail is None:
+                    linked_list.head = new_node
+                else:
+                    tail.next = new_node
+                tail = new_node
+                loaded += 1
+            if progress is not None:
+                progress(loaded)
+        return linked_list
+
+    @classmethod
+    def from_file(cls, path, parse=None, chunk_size=LOAD_CHUNK_SIZE,
+                  progress=None, encoding=None):
+        """Build a linked list from a line-oriented text file, one node per
+           line. The file is read in chunks of whole lines totalling about
+           chunk_size characters(not bytes, the file is read as text), so
+           only one chunk of lines and its parsed batch are held in memory
+           at a time.
+           parse, if given, converts each line(without its line ending)
+           into node data
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive: "
+                             "{0}".format(chunk_size))
+
+        def read_batches():
+            # default buffering, chunk_size is only the readlines() hint
+            with open(path, encoding=encoding) as input_file:
+                while True:
+                    lines = input_file.readlines(chunk_size)
+                    if not lines:
+                        break
+                    if parse is None:
+                        yield [line.rstrip('\r\n') for line in lines]
+                    else:
+                        yield [parse(line.rstrip('\r\n'))
+                               for line in lines]
+
+        return cls.from_chunks(read_batches(), progress)
 
     def insert_head(self, data):
         """ Insert an node at the begenning of the linked list"""
@@ -41,6 +193,7 @@ class SinglyLinkedList:
             self.head = new_node
         else:
             self.head = new_node
+        self._guard.inserted_after(None, new_node)
 
     def insert_end(self, data):
         """Insert an element at the end of the linked list"""
@@ -58,7 +211,9 @@ class SinglyLinkedList:
             last_node.next = new_node
         else:
             # if list is empty
+            last_node = None
             self.head = new_node
+        self._guard.inserted_after(last_node, new_node)
 
     def insert_at(self, data, index):
         """ Insert a node at the specified index starting from 0"""
@@ -79,6 +234,7 @@ class SinglyLinkedList:
             current_node.next = new_node
             new_node.next = temp
             del temp
+            self._guard.inserted_after(current_node, new_node)
 
     def delete_end(self):
         """ Delete a node from the end of linked list"""
@@ -97,6 +253,7 @@ class SinglyLinkedList:
                 current_node = current_node.next
             del current_node
             previous_node.next = None
+        self._guard.nodes_removed()
 
     def delete_head(self):
         """Remove the first node of the linked list"""
@@ -108,6 +265,7 @@ class SinglyLinkedList:
             self.head = None
         else:
             self.head = self.head.next
+        self._guard.nodes_removed()
 
     # index starts at 0
     def delete_at(self, index):
@@ -140,7 +298,94 @@ class SinglyLinkedList:
                 current_node = current_node.next
                 i += 1
             previous_node.next = current_node.next
+            self._guard.linked(current_node.next)
             del current_node
+            self._guard.nodes_removed()
+
+    def __detach_for_teardown(self, chain_head, incremental, batch_size,
+                              pause_gc):
+        """ Queue a detached chain of nodes for teardown and, unless
+            incremental, release it immediately
+        """
+        if chain_head is not None:
+            self._pending_teardown.append(chain_head)
+        if incremental:
+            return
+        if pause_gc:
+            with gc_paused():
+                while self.release_pending(batch_size):
+                    pass
+        else:
+            while self.release_pending(batch_size):
+                pass
+
+    @staticmethod
+    def __check_batch_size(batch_size):
+        """ Raise ValueError for a batch size smaller than 1"""
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive: "
+                             "{0}".format(batch_size))
+
+    def release_pending(self, batch_size=TEARDOWN_BATCH_SIZE):
+        """Unlink up to batch_size nodes queued by an incremental clear()
+           or truncate(). Return True if nodes are still pending
+        """
+        self.__check_batch_size(batch_size)
+        released = 0
+        while self._pending_teardown and released < batch_size:
+            current_node = self._pending_teardown.pop()
+            # break links one node at a time so that dropping the chain
+            # never cascades into a deep chain of deallocations
+            while current_node is not None and released < batch_size:
+                next_node = current_node.next
+                current_node.next = None
+                current_node = next_node
+                released += 1
+            if current_node is not None:
+                self._pending_teardown.append(current_node)
+        return bool(self._pending_teardown)
+
+    def clear(self, incremental=False, batch_size=TEARDOWN_BATCH_SIZE,
+              pause_gc=False):
+        """Remove all nodes from the linked list.
+           Nodes are unlinked iteratively in batches of batch_size.
+           If incremental is True, the nodes are only detached and the
+           teardown is left to later release_pending() calls.
+           If pause_gc is True, the cyclic GC is disabled during teardown.
+        """
+        self.__check_batch_size(batch_size)
+        chain_head = self.head
+        self.head = None
+        # detached nodes(and a recorded cycle) leave the cycle guard
+        self.invalidate_cycle_guard()
+        self.__detach_for_teardown(chain_head, incremental, batch_size,
+                                   pause_gc)
+
+    def truncate(self, length, incremental=False,
+                 batch_size=TEARDOWN_BATCH_SIZE, pause_gc=False):
+        """Keep only the first 'length' nodes of the linked list and
+           tear down the rest (see clear() for the keyword arguments)
+        """
+        if length < 0:
+            raise SinglyLinkedListIndexError("Invalid length: "
+                                             "{0}".format(length))
+        self.__check_batch_size(batch_size)
+        if length == 0:
+            self.clear(incremental, batch_size, pause_gc)
+            return
+        current_node = self.head
+        i = 1
+        while current_node is not None and i < length:
+            current_node = current_node.next
+            i += 1
+        # list is not longer than 'length', nothing to remove
+        if current_node is None:
+            return
+        chain_head = current_node.next
+        current_node.next = None
+        self._guard.nodes_removed()
+        self.__detach_for_teardown(chain_head, incremental, batch_size,
+                                   pause_gc)
 
     def print_elements(self):
         """Print data in all nodes in the linked list"""
@@ -190,12 +435,60 @@ class SinglyLinkedList:
         """Return True is a cycle is detected in the linked list,
         else retruns False
         """
+        if self.cycle_guard is not None:
+            # link() keeps the cycle state, traversed only on a rebuild
+            if self.head is None:
+                raise SinglyLinkedListEmptyError("Empty linked list")
+            self._guard.ready(self.head)
+            return self._guard.cycle_link is not None
         return bool(self.__get_cycle_meet_node())
 
+    def invalidate_cycle_guard(self):
+        """Discard the cycle guard state, so that it is rebuilt from head
+           by the next guarded call. Needed after changing 'next' of
+           nodes directly instead of through link()
+        """
+        self._guard.invalidate()
+
+    def link(self, node, next_node):
+        """Set node.next to next_node(a Node or None).
+           With cycle_guard set, a link that would create a cycle is
+           rejected or recorded when it is made, so that cycle_present()
+           does not traverse the linked list. Both nodes must be part of
+           the linked list: reachable from head, or detached from it since
+           the guard state was last rebuilt.
+           See CycleGuard.creates_cycle() for the cost of the check.
+           Call invalidate_cycle_guard() after changing 'next' directly
+        """
+        if self.cycle_guard is None:
+            node.next = next_node
+            return
+        self._guard.ready(self.head)
+        for argument in (node, next_node)[:1 if next_node is None else 2]:
+            if not self._guard.owns(argument):
+                raise SinglyLinkedListNodeError("{0!r} is not a node of the "
+                                                "linked list".format(argument))
+        creates_cycle = self._guard.creates_cycle(node, next_node)
+        if creates_cycle and self.cycle_guard == 'reject':
+            raise SinglyLinkedListCycleError("Linking node with data={0} "
+                                             "to node with data={1} "
+                                             "would create a cycle"
+                                             .format(node.data,
+                                                     next_node.data))
+        self._guard.link(self.head, node, next_node, creates_cycle)
+
+    set_next = link
+
     # TODO: get cycle start node
     def remove_cycle(self):
         """Removes cycle(if present in the linked list"""
-        if self.cycle_present():
+        if self.cycle_guard is not None:
+            self._guard.ready(self.head)
+        if self._guard.cycle_link is not None:
+            # cycle guard already knows the link which closed the cycle
+            self._guard.cycle_link[0].next = None
+            self._guard.cycle_link = None
+        elif self.__get_cycle_meet_node() is not None:
             # Floyd's cycle detection algorithm - to find starting
             # index of cycle. Point Hare to element at cycle_meet_index
             # and Tortoise to head element and move them at same speed
@@ -219,9 +512,8 @@ class SinglyLinkedList:
             # at this point, hare = tortoise = cycle start node
             # remove the cycle by setting next pointer of last element to None
             previous_hare.next = None
-
-        else:
-            pass
+            # cycle was made by changing 'next' directly
+            self.invalidate_cycle_guard()
 
     def get_node_at_index(self, index):
         """Return node at specified index, starting from 0"""
@@ -324,7 +616,385 @@ class SinglyLinkedList:
             self.head = node1  # to handle edge case node2=self.head
 
         node1.next, node2.next = node2.next, node1.next
+        self.invalidate_cycle_guard()
+
+    def reverse(self):
+        """Reverse the linked list in place"""
+        previous_node = None
+        current_node = self.head
+        while current_node is not None:
+            next_node = current_node.next
+            current_node.next = previous_node
+            previous_node = current_node
+            current_node = next_node
+        self.head = previous_node
+        self.invalidate_cycle_guard()
+
+    def rotate(self, steps):
+        """Rotate the linked list in place by 'steps' positions to the
+           right(to the left for negative steps), like collections.deque
+        """
+        if self.head is None or self.head.next is None:
+            return
+        # one pass to get the length and the last node
+        length = 1
+        last_node = self.head
+        while last_node.next is not None:
+            last_node = last_node.next
+            length += 1
+        steps %= length
+        if steps == 0:
+            return
+        # node at index length - steps - 1 becomes the new last node
+        new_last_node = self.head
+        for _ in range(length - steps - 1):
+            new_last_node = new_last_node.next
+        last_node.next = self.head
+        self.head = new_last_node.next
+        new_last_node.next = None
+        self.invalidate_cycle_guard()
+
+    def reverse_groups(self, group_size):
+        """Reverse each consecutive group of group_size nodes in place.
+           A trailing group shorter than group_size is left as it is
+        """
+        if group_size < 1:
+            raise ValueError("group_size must be positive: "
+                             "{0}".format(group_size))
+        previous_tail = None  # last node of the already processed part
+        group_head = self.head
+        while group_head is not None:
+            # check that a full group is available
+            group_end = group_head
+            count = 1
+            while count < group_size and group_end.next is not None:
+                group_end = group_end.next
+                count += 1
+            if count < group_size:
+                break
+            next_group = group_end.next
+            previous_node = next_group
+            current_node = group_head
+            while current_node is not next_group:
+                next_node = current_node.next
+                current_node.next = previous_node
+                previous_node = current_node
+                current_node = next_node
+            # group_end is the new first node, group_head the new last one
+            if previous_tail is None:
+                self.head = group_end
+            else:
+                previous_tail.next = group_end
+            previous_tail = group_head
+            group_head = next_group
+        self.invalidate_cycle_guard()
+
+    def __relink(self, nodes):
+        """ Relink the given nodes in order and make the first one head"""
+        previous_node = None
+        for node in reversed(nodes):
+            node.next = previous_node
+            previous_node = node
+        self.head = previous_node
+        self.invalidate_cycle_guard()
+
+    def __nodes(self):
+        """ Return all nodes of the linked list in a Python list"""
+        nodes = []
+        current_node = self.head
+        while current_node is not None:
+            nodes.append(current_node)
+            current_node = current_node.next
+        return nodes
+
+    def apply_permutation(self, permutation):
+        """Reorder the nodes in place so that position i holds the node
+           previously at index permutation[i] (indices start from 0)
+        """
+        nodes = self.__nodes()
+        if len(permutation) != len(nodes):
+            raise ValueError("Permutation of length {0} does not match "
+                             "list length={1}".format(len(permutation),
+                                                      len(nodes)))
+        seen = [False] * len(nodes)
+        for index in permutation:
+            if index < 0 or index >= len(nodes):
+                raise SinglyLinkedListIndexError("Index={0} out of range for "
+                                                 "list length={1}"
+                                                 .format(index, len(nodes)))
+            if seen[index]:
+                raise ValueError("Index {0} repeated in "
+                                 "permutation".format(index))
+            seen[index] = True
+        self.__relink([nodes[index] for index in permutation])
+
+    def swap_nodes_batch(self, index_pairs):
+        """Apply a sequence of (index1, index2) node swaps, in order,
+           with one pass to collect the nodes and one pass to relink them
+        """
+        nodes = self.__nodes()
+        for index1, index2 in index_pairs:
+            for index in (index1, index2):
+                if index < 0 or index >= len(nodes):
+                    raise SinglyLinkedListIndexError("Index={0} out of range "
+                                                     "for list length={1}"
+                                                     .format(index,
+                                                             len(nodes)))
+            nodes[index1], nodes[index2] = nodes[index2], nodes[index1]
+        self.__relink(nodes)
+
+    def __keep_if(self, predicate):
+        """ Unlink, in one pass, every node whose data fails predicate.
+            Return the last kept node(None for an empty result)
+        """
+        previous_node = None
+        current_node = self.head
+        while current_node is not None:
+            if predicate(current_node.data):
+                previous_node = current_node
+            elif previous_node is None:
+                self.head = current_node.next
+            else:
+                previous_node.next = current_node.next
+                self._guard.linked(current_node.next)
+            current_node = current_node.next
+        self._guard.nodes_removed()
+        return previous_node
+
+    @staticmethod
+    def __first_seen(key=None):
+        """ Return a predicate which is True only the first time
+            a key(data, if key is None) is seen
+        """
+        seen = set()
+
+        def predicate(data):
+            value = data if key is None else key(data)
+            if value in seen:
+                return False
+            seen.add(value)
+            return True
+        return predicate
+
+    @staticmethod
+    def __first_of_run(key=None):
+        """ Return a predicate which is True only for the first data of each
+            run of equal keys, for sorted input(O(1) extra memory)
+        """
+        started = False
+        previous = None
+
+        def predicate(data):
+            nonlocal started, previous
+            value = data if key is None else key(data)
+            if started and value == previous:
+                return False
+            started = True
+            previous = value
+            return True
+        return predicate
+
+    def __last_seen(self, key=None):
+        """ Return a predicate which is True only the last time a key(data,
+            if key is None) is seen. Counts the keys in one pass first
+        """
+        remaining = {}
+        current_node = self.head
+        while current_node is not None:
+            data = current_node.data
+            value = data if key is None else key(data)
+            remaining[value] = remaining.get(value, 0) + 1
+            current_node = current_node.next
+
+        def predicate(data):
+            value = data if key is None else key(data)
+            remaining[value] -= 1
+            return remaining[value] == 0
+        return predicate
+
+    def __keep_last_of_runs(self, key=None):
+        """ Unlink every node followed by a node with an equal key, keeping
+            the last node of each run, for sorted input(O(1) extra memory)
+        """
+        previous_node = None
+        current_node = self.head
+        value = None
+        if current_node is not None:
+            data = current_node.data
+            value = data if key is None else key(data)
+        while current_node is not None:
+            next_node = current_node.next
+            if next_node is None:
+                break
+            data = next_node.data
+            next_value = data if key is None else key(data)
+            if next_value != value:
+                previous_node = current_node
+            elif previous_node is None:
+                self.head = next_node
+            else:
+                previous_node.next = next_node
+                self._guard.linked(next_node)
+            current_node = next_node
+            value = next_value
+        self._guard.nodes_removed()
+
+    def dedupe(self, key=None, keep='first', assume_sorted=False):
+        """Remove nodes with duplicate data(or duplicate key(data)) in place.
+           keep is 'first' or 'last' and selects which duplicate survives.
+           If assume_sorted is True, duplicates are expected to be adjacent
+           and no hash set is used
+        """
+        if keep not in ('first', 'last'):
+            raise ValueError("keep must be 'first' or 'last': "
+                             "{0}".format(keep))
+        if keep == 'first' and assume_sorted:
+            self.__keep_if(self.__first_of_run(key))
+        elif keep == 'first':
+            self.__keep_if(self.__first_seen(key))
+        elif assume_sorted:
+            self.__keep_last_of_runs(key)
+        else:
+            self.__keep_if(self.__last_seen(key))
+
+    @staticmethod
+    def __data_set(other):
+        """ Return data of a linked list or an iterable as a set"""
+        if isinstance(other, SinglyLinkedList):
+            data = set()
+            current_node = other.head
+            while current_node is not None:
+                data.add(current_node.data)
+                current_node = current_node.next
+            return data
+        return set(other)
+
+    def union(self, other):
+        """Update the linked list in place to the distinct data present in
+           it or in other(a linked list or an iterable). Nodes of another
+           linked list are moved over, leaving it empty
+        """
+        first_seen = self.__first_seen()
+        tail = self.__keep_if(first_seen)
+        if other is self:
+            # union with itself only removes duplicates
+            return
+        # nodes added below are not stamped for the cycle guard
+        self.invalidate_cycle_guard()
+        if isinstance(other, SinglyLinkedList):
+            chain_head = other.head
+            other.head = None
+            other.invalidate_cycle_guard()
+            # splice other's nodes after tail, skipping duplicates
+            current_node = chain_head
+            while current_node is not None:
+                next_node = current_node.next
+                current_node.next = None
+                if first_seen(current_node.data):
+                    if tail is None:
+                        self.head = current_node
+                    else:
+                        tail.next = current_node
+                    tail = current_node
+                current_node = next_node
+        else:
+            for data in other:
+                if first_seen(data):
+                    new_node = Node(data)
+                    if tail is None:
+                        self.head = new_node
+                    else:
+                        tail.next = new_node
+                    tail = new_node
+
+    def intersection(self, other):
+        """Update the linked list in place to the distinct data present both
+           in it and in other(a linked list or an iterable)
+        """
+        other_data = self.__data_set(other)
+        first_seen = self.__first_seen()
+        self.__keep_if(lambda data: data in other_data and first_seen(data))
+
+    def difference(self, other):
+        """Update the linked list in place to the distinct data present in
+           it but not in other(a linked list or an iterable)
+        """
+        other_data = self.__data_set(other)
+        first_seen = self.__first_seen()
+        self.__keep_if(lambda data: data not in other_data and
+                       first_seen(data))
+
+    def memory_report(self):
+        """Walk the linked list iteratively and return a dictionary with
+           node count, bytes used by nodes and by payloads(each distinct
+           payload object counted once), payloads referenced by one node
+           (unique) versus several nodes(shared) and estimated savings of
+           compact(__slots__) nodes or of an array(Python list) of payloads.
+           Payload sizes are shallow(sys.getsizeof()): objects referenced
+           by a payload, e.g. items of a container, are not counted.
+           guard_bytes are the cycle guard stamps kept by the nodes
+        """
+        nodes = 0
+        payload_bytes = 0
+        guard_bytes = 0
+        payload_ids = set()
+        shared_ids = set()
+        current_node = self.head
+        while current_node is not None:
+            nodes += 1
+            payload_id = id(current_node.data)
+            if payload_id not in payload_ids:
+                payload_ids.add(payload_id)
+                payload_bytes += sys.getsizeof(current_node.data)
+            else:
+                shared_ids.add(payload_id)
+            if current_node.guard is not None:
+                guard_bytes += (sys.getsizeof(current_node.guard) +
+                                sys.getsizeof(current_node.guard.order))
+            current_node = current_node.next
+        node_bytes = nodes * _node_size(Node)
+        compact_node_bytes = nodes * _node_size(_CompactNode)
+        array_bytes = sys.getsizeof([]) + nodes * struct.calcsize('P')
+        return {
+            'nodes': nodes,
+            'node_bytes': node_bytes,
+            'payload_bytes': payload_bytes,
+            'guard_bytes': guard_bytes,
+            'total_bytes': node_bytes + payload_bytes + guard_bytes,
+            'distinct_payloads': len(payload_ids),
+            'unique_payloads': len(payload_ids) - len(shared_ids),
+            'shared_payloads': len(shared_ids),
+            'duplicate_references': nodes - len(payload_ids),
+            'compact_node_bytes': compact_node_bytes,
+            'compact_node_savings': node_bytes - compact_node_bytes,
+            'array_bytes': array_bytes,
+            'array_savings': node_bytes - array_bytes,
+        }
+
+
+def main(argv=None):
+    """Command line entry point.
+       memory-report: load a line-oriented file into a linked list
+       and print its memory report
+    """
+    parser = argparse.ArgumentParser(prog='singly_linkedlist')
+    subparsers = parser.add_subparsers(dest='command')
+    subparsers.required = True
+    report_parser = subparsers.add_parser('memory-report',
+                                          help="print memory usage of a "
+                                               "list loaded from a file")
+    report_parser.add_argument('path', help="file with one value per line")
+    report_parser.add_argument('--parse', choices=('str', 'int', 'float'),
+                               default='str',
+                               help="type of the values in the file")
+    args = parser.parse_args(argv)
+
+    parse = {'str': None, 'int': int, 'float': float}[args.parse]
+    linked_list = SinglyLinkedList.from_file(args.path, parse=parse)
+    for name, value in linked_list.memory_report().items():
+        print("{0}: {1}".format(name, value))
+    return 0
 
 
 if __name__ == '__main__':
-    pass
+    sys.exit(main())
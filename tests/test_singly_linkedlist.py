@@ -1,9 +1,12 @@
 # pylint: disable=missing-function-docstring,redefined-outer-name,
 # pylint: disable=protected-access,missing-module-docstring
+import gc
+import random
 import pytest
 from singly_linkedlist.singly_linkedlist import Node, \
     SinglyLinkedList, SinglyLinkedListException, SinglyLinkedListIndexError, \
-    SinglyLinkedListEmptyError
+    SinglyLinkedListEmptyError, SinglyLinkedListCycleError, \
+    SinglyLinkedListNodeError, gc_paused, gc_unfreeze, main
 
 
 # return an empty linked list
@@ -427,3 +430,494 @@ def test_swap_nodes_out_of_range_index2_exception(test_linkedlist):
     test_linkedlist.insert_end('B')
     with pytest.raises(SinglyLinkedListException):
         test_linkedlist.swap_nodes_at_indices(0, 2)
+
+
+def test_clear(test_linkedlist):
+    for i in range(5):
+        test_linkedlist.insert_end(i)
+    test_linkedlist.clear(batch_size=2)
+    assert test_linkedlist.head is None
+    assert not test_linkedlist._pending_teardown
+
+
+def test_clear_incremental(test_linkedlist):
+    for i in range(5):
+        test_linkedlist.insert_end(i)
+    first_node = test_linkedlist.head
+    test_linkedlist.clear(incremental=True)
+    assert test_linkedlist.head is None
+    assert test_linkedlist.release_pending(batch_size=2)
+    assert first_node.next is None
+    assert test_linkedlist.release_pending(batch_size=2)
+    assert not test_linkedlist.release_pending(batch_size=2)
+
+
+def test_release_pending_invalid_batch_size(test_linkedlist):
+    with pytest.raises(ValueError):
+        test_linkedlist.release_pending(batch_size=0)
+
+
+@pytest.mark.parametrize("incremental", [False, True])
+def test_clear_invalid_batch_size_keeps_list(test_linkedlist, incremental):
+    test_linkedlist.insert_end('A')
+    with pytest.raises(ValueError):
+        test_linkedlist.clear(incremental=incremental, batch_size=0)
+    assert test_linkedlist.head.data == 'A'
+    assert not test_linkedlist._pending_teardown
+
+
+def test_truncate_invalid_batch_size_keeps_list(test_linkedlist):
+    test_linkedlist.insert_end('A')
+    test_linkedlist.insert_end('B')
+    with pytest.raises(ValueError):
+        test_linkedlist.truncate(1, batch_size=0)
+    assert test_linkedlist.list_length() == 2
+
+
+def test_truncate(test_linkedlist):
+    for i in range(5):
+        test_linkedlist.insert_end(i)
+    test_linkedlist.truncate(2, pause_gc=True)
+    assert test_linkedlist.list_length() == 2
+    assert test_linkedlist.head.next.data == 1
+
+
+def test_truncate_longer_than_list(test_linkedlist):
+    test_linkedlist.insert_end('A')
+    test_linkedlist.truncate(3)
+    assert test_linkedlist.list_length() == 1
+
+
+def test_truncate_negative_length_exception(test_linkedlist):
+    with pytest.raises(SinglyLinkedListIndexError):
+        test_linkedlist.truncate(-1)
+
+
+def test_gc_paused_restores_gc_state():
+    assert gc.isenabled()
+    with gc_paused():
+        assert not gc.isenabled()
+    assert gc.isenabled()
+
+
+@pytest.mark.skipif(not hasattr(gc, 'freeze'), reason="needs gc.freeze()")
+def test_gc_paused_freeze_and_unfreeze():
+    with gc_paused(freeze=True):
+        pass
+    try:
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc_unfreeze()
+    assert gc.get_freeze_count() == 0
+
+
+def collect_data(linked_list):
+    data = []
+    current_node = linked_list.head
+    while current_node is not None:
+        data.append(current_node.data)
+        current_node = current_node.next
+    return data
+
+
+def test_from_chunks():
+    progress = []
+    linked_list = SinglyLinkedList.from_chunks([[1, 2], [], [3]],
+                                               progress=progress.append)
+    assert collect_data(linked_list) == [1, 2, 3]
+    assert progress == [2, 2, 3]
+
+
+def test_from_chunks_empty():
+    assert SinglyLinkedList.from_chunks([]).head is None
+
+
+def test_from_file(tmp_path):
+    input_file = tmp_path / 'input.txt'
+    input_file.write_text('1\n2\n3\n')
+    progress = []
+    linked_list = SinglyLinkedList.from_file(str(input_file), parse=int,
+                                             chunk_size=2,
+                                             progress=progress.append)
+    assert collect_data(linked_list) == [1, 2, 3]
+    assert progress[-1] == 3
+
+
+def test_from_file_invalid_chunk_size(tmp_path):
+    with pytest.raises(ValueError):
+        SinglyLinkedList.from_file(str(tmp_path / 'input.txt'), chunk_size=0)
+
+
+def build_list(values):
+    return SinglyLinkedList.from_chunks([values])
+
+
+def test_reverse():
+    linked_list = build_list([1, 2, 3])
+    linked_list.reverse()
+    assert collect_data(linked_list) == [3, 2, 1]
+
+
+def test_reverse_empty_list(test_linkedlist):
+    test_linkedlist.reverse()
+    assert test_linkedlist.head is None
+
+
+@pytest.mark.parametrize("steps, expected", [
+    (0, [1, 2, 3, 4]),
+    (1, [4, 1, 2, 3]),
+    (-1, [2, 3, 4, 1]),
+    (6, [3, 4, 1, 2]),
+])
+def test_rotate(steps, expected):
+    linked_list = build_list([1, 2, 3, 4])
+    linked_list.rotate(steps)
+    assert collect_data(linked_list) == expected
+
+
+def test_reverse_groups():
+    linked_list = build_list([1, 2, 3, 4, 5, 6, 7, 8])
+    linked_list.reverse_groups(3)
+    assert collect_data(linked_list) == [3, 2, 1, 6, 5, 4, 7, 8]
+
+
+def test_reverse_groups_invalid_group_size(test_linkedlist):
+    with pytest.raises(ValueError):
+        test_linkedlist.reverse_groups(0)
+
+
+def test_apply_permutation():
+    linked_list = build_list(['A', 'B', 'C'])
+    node_a = linked_list.head
+    linked_list.apply_permutation([2, 0, 1])
+    assert collect_data(linked_list) == ['C', 'A', 'B']
+    # existing nodes are relinked, not copied
+    assert linked_list.head.next is node_a
+
+
+def test_apply_permutation_invalid():
+    linked_list = build_list(['A', 'B', 'C'])
+    with pytest.raises(ValueError):
+        linked_list.apply_permutation([0, 1])
+    with pytest.raises(ValueError):
+        linked_list.apply_permutation([0, 0, 1])
+    with pytest.raises(SinglyLinkedListIndexError):
+        linked_list.apply_permutation([0, 1, 3])
+    assert collect_data(linked_list) == ['A', 'B', 'C']
+
+
+def test_swap_nodes_batch():
+    linked_list = build_list([1, 2, 3, 4])
+    linked_list.swap_nodes_batch([(0, 3), (1, 2), (0, 1)])
+    assert collect_data(linked_list) == [3, 4, 2, 1]
+
+
+def test_swap_nodes_batch_out_of_range_exception():
+    linked_list = build_list([1, 2])
+    with pytest.raises(SinglyLinkedListIndexError):
+        linked_list.swap_nodes_batch([(0, 2)])
+
+
+@pytest.mark.parametrize("keep, assume_sorted, values, expected", [
+    ('first', False, [1, 2, 1, 3, 2], [1, 2, 3]),
+    ('last', False, [1, 2, 1, 3, 2], [1, 3, 2]),
+    ('first', True, [1, 1, 2, 3, 3], [1, 2, 3]),
+    ('last', True, [1, 1, 2, 3, 3], [1, 2, 3]),
+    ('first', False, [], []),
+    ('last', True, [], []),
+    ('last', True, [1, 1, 1], [1]),
+])
+def test_dedupe(keep, assume_sorted, values, expected):
+    linked_list = build_list(values)
+    linked_list.dedupe(keep=keep, assume_sorted=assume_sorted)
+    assert collect_data(linked_list) == expected
+
+
+def test_dedupe_key():
+    linked_list = build_list(['a', 'B', 'A', 'b'])
+    linked_list.dedupe(key=str.lower, keep='last')
+    assert collect_data(linked_list) == ['A', 'b']
+
+
+def test_dedupe_keep_last_relinks_last_nodes():
+    linked_list = build_list([1, 1, 2, 2])
+    last_node = linked_list.head.next.next.next
+    linked_list.dedupe(keep='last', assume_sorted=True)
+    assert linked_list.head.next is last_node
+
+
+def test_dedupe_keep_last_key_error_keeps_order():
+    def key(data):
+        if data == 'x':
+            raise TypeError("bad key")
+        return data
+    linked_list = build_list([1, 2, 'x', 3])
+    with pytest.raises(TypeError):
+        linked_list.dedupe(key=key, keep='last')
+    assert collect_data(linked_list) == [1, 2, 'x', 3]
+
+
+def test_dedupe_invalid_keep():
+    with pytest.raises(ValueError):
+        build_list([1]).dedupe(keep='middle')
+
+
+def test_union_linked_list():
+    linked_list = build_list([1, 2, 2])
+    other = build_list([2, 3, 4, 3])
+    node_3 = other.head.next
+    linked_list.union(other)
+    assert collect_data(linked_list) == [1, 2, 3, 4]
+    assert linked_list.head.next.next is node_3
+    assert other.head is None
+
+
+def test_union_self():
+    linked_list = build_list([1, 2, 1, 3])
+    linked_list.union(linked_list)
+    assert collect_data(linked_list) == [1, 2, 3]
+
+
+def test_union_iterable(test_linkedlist):
+    test_linkedlist.union([1, 1, 2])
+    assert collect_data(test_linkedlist) == [1, 2]
+
+
+def test_intersection():
+    linked_list = build_list([1, 2, 3, 2, 4])
+    linked_list.intersection(build_list([4, 2]))
+    assert collect_data(linked_list) == [2, 4]
+
+
+def test_difference():
+    linked_list = build_list([1, 2, 3, 1, 4])
+    linked_list.difference({2, 4})
+    assert collect_data(linked_list) == [1, 3]
+
+
+def test_memory_report_empty_list(test_linkedlist):
+    report = test_linkedlist.memory_report()
+    assert report['nodes'] == 0
+    assert report['total_bytes'] == 0
+
+
+def test_memory_report():
+    payload = 'shared payload'
+    linked_list = build_list([payload, payload, payload, 'other payload'])
+    report = linked_list.memory_report()
+    assert report['nodes'] == 4
+    assert report['distinct_payloads'] == 2
+    assert report['unique_payloads'] == 1
+    assert report['shared_payloads'] == 1
+    assert report['duplicate_references'] == 2
+    assert report['node_bytes'] > 0
+    assert report['guard_bytes'] == 0
+    assert report['total_bytes'] == (report['node_bytes'] +
+                                     report['payload_bytes'])
+    assert report['compact_node_savings'] > 0
+
+
+def test_main_memory_report(tmp_path, capfd):
+    input_file = tmp_path / 'input.txt'
+    input_file.write_text('1\n2\n')
+    assert main(['memory-report', str(input_file), '--parse', 'int']) == 0
+    out, _ = capfd.readouterr()
+    assert 'nodes: 2\n' in out
+
+
+def build_guarded_list(values, cycle_guard):
+    linked_list = SinglyLinkedList(cycle_guard=cycle_guard)
+    for value in values:
+        linked_list.insert_end(value)
+    return linked_list
+
+
+def test_memory_report_guard_bytes():
+    linked_list = build_guarded_list(['A', 'B', 'C'], 'reject')
+    assert linked_list.memory_report()['guard_bytes'] == 0
+    assert not linked_list.cycle_present()
+    report = linked_list.memory_report()
+    assert report['guard_bytes'] > 0
+    assert report['total_bytes'] == (report['node_bytes'] +
+                                     report['payload_bytes'] +
+                                     report['guard_bytes'])
+
+
+def test_invalid_cycle_guard_exception():
+    with pytest.raises(ValueError):
+        SinglyLinkedList(cycle_guard='ignore')
+
+
+def test_link_without_guard():
+    linked_list = build_list(['A', 'B', 'C'])
+    linked_list.link(linked_list.head.next.next, linked_list.head)
+    assert linked_list.cycle_present()
+    linked_list.remove_cycle()
+    assert collect_data(linked_list) == ['A', 'B', 'C']
+
+
+def test_link_reject_cycle():
+    linked_list = build_guarded_list(['A', 'B', 'C'], 'reject')
+    with pytest.raises(SinglyLinkedListCycleError):
+        linked_list.link(linked_list.head.next.next, linked_list.head.next)
+    assert linked_list.head.next.next.next is None
+    assert not linked_list.cycle_present()
+
+
+def test_link_reject_allows_acyclic_link():
+    linked_list = build_guarded_list(['A', 'B', 'C'], 'reject')
+    linked_list.set_next(linked_list.head, linked_list.head.next.next)
+    assert collect_data(linked_list) == ['A', 'C']
+
+
+def test_link_record_cycle():
+    linked_list = build_guarded_list(['A', 'B', 'C', 'D'], 'record')
+    last_node = linked_list.head.next.next.next
+    linked_list.link(last_node, linked_list.head.next)
+    assert linked_list.cycle_present()
+    assert linked_list._guard.cycle_link == (last_node, linked_list.head.next)
+    linked_list.remove_cycle()
+    assert not linked_list.cycle_present()
+    assert collect_data(linked_list) == ['A', 'B', 'C', 'D']
+
+
+def test_link_record_cycle_broken_by_link():
+    linked_list = build_guarded_list(['A', 'B', 'C', 'D'], 'record')
+    node_b = linked_list.head.next
+    node_c = node_b.next
+    linked_list.link(node_c.next, node_b)
+    # linking into the existing cycle does not loop forever
+    linked_list.link(linked_list.head, node_c)
+    assert linked_list.cycle_present()
+    # replacing a link on the cycle breaks it
+    linked_list.link(node_c, None)
+    assert not linked_list.cycle_present()
+    assert collect_data(linked_list) == ['A', 'C']
+
+
+def test_cycle_present_guarded_empty_list_exception():
+    with pytest.raises(SinglyLinkedListEmptyError):
+        SinglyLinkedList(cycle_guard='record').cycle_present()
+
+
+def test_link_foreign_node_exception():
+    linked_list = build_guarded_list(['A', 'B', 'C'], 'record')
+    with pytest.raises(SinglyLinkedListNodeError):
+        linked_list.link(Node('X'), linked_list.head)
+    with pytest.raises(SinglyLinkedListNodeError):
+        linked_list.link(linked_list.head, Node('X'))
+    with pytest.raises(SinglyLinkedListNodeError):
+        linked_list.link(None, linked_list.head)
+    assert not linked_list.cycle_present()
+    assert collect_data(linked_list) == ['A', 'B', 'C']
+
+
+def test_link_moves_node_later_without_cycle():
+    linked_list = build_guarded_list(['A', 'B', 'C', 'D'], 'reject')
+    node_b = linked_list.head.next
+    node_d = node_b.next.next
+    # move B after D
+    linked_list.link(linked_list.head, node_b.next)
+    linked_list.link(node_b, None)
+    linked_list.link(node_d, node_b)
+    assert collect_data(linked_list) == ['A', 'C', 'D', 'B']
+    with pytest.raises(SinglyLinkedListCycleError):
+        linked_list.link(node_b, linked_list.head.next)
+
+
+def test_truncate_removes_recorded_cycle():
+    linked_list = build_guarded_list(['A', 'B', 'C', 'D'], 'record')
+    node_b = linked_list.head.next
+    linked_list.link(node_b.next.next, node_b)
+    linked_list.truncate(2)
+    assert not linked_list.cycle_present()
+    assert collect_data(linked_list) == ['A', 'B']
+
+
+def test_reverse_keeps_cycle_guard_consistent():
+    linked_list = build_guarded_list(['A', 'B', 'C'], 'reject')
+    linked_list.reverse()
+    with pytest.raises(SinglyLinkedListCycleError):
+        linked_list.link(linked_list.head.next.next, linked_list.head)
+    linked_list.link(linked_list.head, linked_list.head.next.next)
+    assert collect_data(linked_list) == ['C', 'A']
+
+
+def test_direct_next_change_with_guard():
+    linked_list = build_guarded_list(['A', 'B', 'C'], 'record')
+    linked_list.head.next.next.next = linked_list.head
+    linked_list.invalidate_cycle_guard()
+    assert linked_list.cycle_present()
+    linked_list.remove_cycle()
+    assert not linked_list.cycle_present()
+    assert collect_data(linked_list) == ['A', 'B', 'C']
+
+
+def test_remove_cycle_guarded_falls_back_to_floyd():
+    linked_list = build_guarded_list(['A', 'B', 'C'], 'record')
+    linked_list.head.next.next.next = linked_list.head.next
+    linked_list.remove_cycle()
+    assert collect_data(linked_list) == ['A', 'B', 'C']
+
+
+def reference_cycle_present(linked_list):
+    seen = set()
+    current_node = linked_list.head
+    while current_node is not None:
+        if id(current_node) in seen:
+            return True
+        seen.add(id(current_node))
+        current_node = current_node.next
+    return False
+
+
+def test_cycle_guard_matches_reference_for_random_links():
+    generator = random.Random(31)
+    linked_list = build_guarded_list(range(30), 'record')
+    nodes = []
+    current_node = linked_list.head
+    while current_node is not None:
+        nodes.append(current_node)
+        current_node = current_node.next
+    for _ in range(2000):
+        choice = generator.random()
+        if choice < 0.05:
+            linked_list.remove_cycle()
+        elif choice < 0.1 and not reference_cycle_present(linked_list):
+            linked_list.insert_head('new')
+            nodes.append(linked_list.head)
+        else:
+            next_node = generator.choice(nodes + [None])
+            try:
+                linked_list.link(generator.choice(nodes), next_node)
+            except SinglyLinkedListNodeError:
+                pass
+        if linked_list.head is not None:
+            assert (linked_list.cycle_present() ==
+                    reference_cycle_present(linked_list))
+
+
+def test_link_into_pending_incremental_chain_exception():
+    linked_list = build_guarded_list(['A', 'B', 'C', 'D'], 'record')
+    node_b = linked_list.head.next
+    linked_list.link(node_b.next.next, node_b)
+    linked_list.clear(incremental=True)
+    for value in ['E', 'F', 'G', 'H', 'I']:
+        linked_list.insert_end(value)
+    last_node = linked_list.head.next.next.next.next
+    with pytest.raises(SinglyLinkedListNodeError):
+        linked_list.link(last_node, node_b)
+    assert not linked_list.cycle_present()
+
+
+def test_union_moved_nodes_leave_guarded_other():
+    linked_list = build_guarded_list(['A'], 'record')
+    other = build_guarded_list(['B', 'C'], 'record')
+    moved_node = other.head
+    assert not other.cycle_present()
+    linked_list.union(other)
+    other.insert_end('Z')
+    with pytest.raises(SinglyLinkedListNodeError):
+        other.link(other.head, moved_node)
+    assert collect_data(linked_list) == ['A', 'B', 'C']
+    assert collect_data(other) == ['Z']